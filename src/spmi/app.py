@@ -10,7 +10,9 @@ Execute next command to get help message:
 """
 
 import os
+import resource
 import subprocess
+from contextlib import ExitStack
 from pathlib import Path
 from docopt import docopt
 from spmi.core.pool import Pool
@@ -18,6 +20,7 @@ from spmi.utils.logger import Logger
 from spmi.utils.pattern import PatternMatcher, RegexPatternMatcher
 from spmi.core.manageable import Manageable
 from spmi.utils.exception import SpmiException
+from spmi.utils.concurrency import thread_map
 
 HELP_MESSAGE = r"""
    _____ ____  __  _______
@@ -206,13 +209,26 @@ class Spmi:
         self._logger.debug("Creating pool")
         self._pool = Pool(path=self._config.path, pm=pm)
 
+    START_BATCH_SIZE = 16
+    """:obj:`int`: Maximum number of manageables entered at once by :meth:`start`.
+
+    Each entered manageable holds its data and meta files open.
+    """
+
+    START_DESCRIPTORS_PER_MANAGEABLE = 8
+    """:obj:`int`: File descriptors reserved for each manageable started in a batch.
+
+    Besides its own files a manageable needs descriptors for backend
+    processes and logging, so batches are limited to the soft
+    ``RLIMIT_NOFILE`` divided by this number.
+    """
+
     def load(self, pathes):
         loaded = 0
         try:
-            to_load = []
-
-            for path in pathes:
-                to_load.append(Manageable.from_descriptor(path))
+            # Descriptors are parsed in threads, the first failure
+            # is raised before anything is registered.
+            to_load = thread_map(Manageable.from_descriptor, pathes)
 
             for m in to_load:
                 self._pool.register(m)
@@ -228,15 +244,17 @@ class Spmi:
         """Prints list of manageables."""
         self._logger.debug("Listing manageables")
 
+        manageables = self._pool.manageables
+        self._pool.refresh_backends(manageables)
         states = []
-        for manageable in self._pool.manageables:
+        for manageable in manageables:
             with manageable:
                 states.append(
                     (manageable.state, str(manageable.status.name.lower()))
                 )
 
         self._logger.info(
-            f"Registered {len(self._pool.manageables)} manageable{'' if len(self._pool.manageables) == 1 else 's'}"
+            f"Registered {len(manageables)} manageable{'' if len(manageables) == 1 else 's'}"
         )
 
         max_id_len = 1 if not states else max(map(lambda x: len(x[0].id), states)) + 1
@@ -250,17 +268,15 @@ class Spmi:
         )
         max_comment_len = max(max_comment_len, 10)
 
-        print(
+        lines = [
             f"{{:{max_id_len}}}{{:<{max_active_len}}}{{:<{max_comment_len}}}".format(
                 "ID", "ACTIVE", "COMMENT"
             )
-        )
+        ]
+        line = f"{{:<{max_id_len}}}{{:<{max_active_len}}}{{:<{max_comment_len}}}"
         for s in states:
-            print(
-                f"{{:<{max_id_len}}}{{:<{max_active_len}}}{{:<{max_comment_len}}}".format(
-                    s[0].id, s[1], s[0].comment
-                )
-            )
+            lines.append(line.format(s[0].id, s[1], s[0].comment))
+        print("\n".join(lines))
 
     def start(self, patterns):
         """Starts all manageables corresponding to pattern.
@@ -268,49 +284,94 @@ class Spmi:
         Args:
             pattern (:obj:`str`): Pattern string.
         """
-        to_start = []
-        for pattern in patterns:
-            to_start.extend(self._pool.find(pattern))
+        to_start = self._pool.find_all(patterns)
         started = 0
 
         if len(to_start) == 0:
             self._logger.warning("Nothing to start")
         else:
+            batches = {}
             for manageable in to_start:
-                try:
-                    self._logger.info(f'Starting manageable "{manageable.state.id}"')
-                    with manageable:
-                        manageable.start()
-                    started += 1
-                except SpmiException as e:
-                    self._logger.error(f'Failed to start "{manageable.state.id}":\n{e}')
-                    if self._args.debug:
-                        raise
+                batches.setdefault(type(manageable), []).append(manageable)
+
+            soft_limit = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+            batch_size = self.START_BATCH_SIZE
+            if soft_limit != resource.RLIM_INFINITY:
+                batch_size = max(
+                    1,
+                    min(batch_size, soft_limit // self.START_DESCRIPTORS_PER_MANAGEABLE),
+                )
+
+            for cls, manageables in batches.items():
+                for i in range(0, len(manageables), batch_size):
+                    started += self._start_batch(cls, manageables[i : i + batch_size])
 
         self._logger.info(f"Started {started} manageables")
 
+    def _start_batch(self, cls, manageables):
+        """Enters manageables, starts them together and exits them.
+
+        Failure of one manageable does not stop the others. Manageables
+        are exited in reverse order, as nested ``with`` statements do.
+
+        Args:
+            cls (:obj:`type`): Class of manageables.
+            manageables (:obj:`list` of :obj:`spmi.core.manageable.Manageable`): Manageables.
+
+        Returns:
+            :obj:`int`: Number of started manageables.
+        """
+        entered = []
+        failed = []
+        try:
+            with ExitStack() as stack:
+                for manageable in manageables:
+                    manageable_id = manageable.state.id
+                    self._logger.info(f'Starting manageable "{manageable_id}"')
+                    try:
+                        stack.enter_context(manageable)
+                    except (OSError, SpmiException) as e:
+                        self._logger.error(f'Failed to start "{manageable_id}":\n{e}')
+                        if self._args.debug:
+                            raise
+                        continue
+                    entered.append(manageable)
+
+                failed = cls.start_many(entered)
+        except (OSError, SpmiException) as e:
+            if self._args.debug:
+                raise
+            # the other manageables are exited anyway
+            self._logger.error(f"Failed to start manageables:\n{e}")
+
+        for manageable, e in failed:
+            self._logger.error(f'Failed to start "{manageable.state.id}":\n{e}')
+        if failed and self._args.debug:
+            raise failed[0][1]
+
+        return len(entered) - len(set(map(id, (m for m, _ in failed))))
+
     def stop(self, patterns):
         """Stops all manageables corresponding to pattern.
 
         Args:
             pattern (:obj:`str`): Pattern string.
         """
-        to_stop = []
-        for pattern in patterns:
-            to_stop.extend(self._pool.find(pattern))
+        to_stop = self._pool.find_all(patterns)
         stopped = 0
 
         if len(to_stop) == 0:
             self._logger.warning("Nothing to stop")
         else:
             for manageable in to_stop:
+                manageable_id = manageable.state.id
                 try:
-                    self._logger.info(f'Stopping manageable "{manageable.state.id}"')
+                    self._logger.info(f'Stopping manageable "{manageable_id}"')
                     with manageable:
                         manageable.term()
                     stopped += 1
                 except SpmiException as e:
-                    self._logger.error(f'Failed to stop "{manageable.state.id}":\n{e}')
+                    self._logger.error(f'Failed to stop "{manageable_id}":\n{e}')
                     if self._args.debug:
                         raise
 
@@ -322,22 +383,21 @@ class Spmi:
         Args:
             pattern (:obj:`str`): Pattern string.
         """
-        to_kill = []
-        for pattern in patterns:
-            to_kill.extend(self._pool.find(pattern))
+        to_kill = self._pool.find_all(patterns)
         killed = 0
 
         if len(to_kill) == 0:
             self._logger.warning("Nothing to kill")
         else:
             for manageable in to_kill:
+                manageable_id = manageable.state.id
                 try:
-                    self._logger.info(f'Killing manageable "{manageable.state.id}"')
+                    self._logger.info(f'Killing manageable "{manageable_id}"')
                     with manageable:
                         manageable.kill()
                     killed += 1
                 except SpmiException as e:
-                    self._logger.error(f'Failed to kill "{manageable.state.id}":\n{e}')
+                    self._logger.error(f'Failed to kill "{manageable_id}":\n{e}')
                     if self._args.debug:
                         raise
 
@@ -349,16 +409,17 @@ class Spmi:
         Args:
             pattern (:obj:`str`): Pattern string.
         """
-        to_show = []
-        for pattern in patterns:
-            to_show.extend(self._pool.find(pattern))
+        to_show = self._pool.find_all(patterns)
 
         if len(to_show) == 0:
             self._logger.warning("Nothing to show")
         else:
+            self._pool.refresh_backends(to_show)
+            strings = []
             for manageable in to_show:
                 with manageable:
-                    print(manageable.status_string())
+                    strings.append(manageable.status_string())
+            print("\n".join(strings))
 
         self._logger.info(f"Showed {len(to_show)} manageables")
 
@@ -368,26 +429,26 @@ class Spmi:
         Args:
             pattern (:obj:`str`): Pattern string.
         """
-        to_clean = []
-        for pattern in patterns:
-            to_clean.extend(self._pool.find(pattern))
-        cleaned = 0
+        to_clean = self._pool.find_all(patterns)
+        cleaned = []
 
         if len(to_clean) == 0:
             self._logger.warning("Nothing to clean")
         else:
             for manageable in to_clean:
+                manageable_id = manageable.state.id
                 try:
-                    self._logger.info(f'Cleaning manageable "{manageable.state.id}"')
+                    self._logger.info(f'Cleaning manageable "{manageable_id}"')
                     with manageable:
                         manageable.destruct()
-                    cleaned += 1
+                    cleaned.append(manageable)
                 except SpmiException as e:
-                    self._logger.error(f'Failed to clean "{manageable.state.id}":\n{e}')
+                    self._logger.error(f'Failed to clean "{manageable_id}":\n{e}')
                     if self._args.debug:
                         raise
 
-        self._logger.info(f"Cleaned {cleaned} manageables")
+        self._pool.remove(cleaned)
+        self._logger.info(f"Cleaned {len(cleaned)} manageables")
 
     def connect(self, task_id):
         """Prints stdout of task and prints to it stdin.
@@ -400,13 +461,14 @@ class Spmi:
         task = tasks[0]
 
         with task:
-            stdout_path = task.state.wrapper.stdout_path
+            wrapper = task.state.wrapper
+            stdout_path = wrapper.stdout_path
 
             assert stdout_path and stdout_path.exists()
 
             print(subprocess.check_output(f"cat '{stdout_path}'", shell=True).decode("utf-8"))
 
-            stdin_path = task.state.wrapper.stdin_path
+            stdin_path = wrapper.stdin_path
             if stdin_path and stdin_path.exists():
                 with open(stdin_path, "w") as pipe:
                     pipe.write(input() + "\n")
@@ -1,16 +1,16 @@
 """Provides :class:`Manageable`.
 """
 
+import os
 import shutil
 from enum import Enum
 from datetime import datetime, timedelta
 from abc import abstractmethod, ABCMeta
 from pathlib import Path
 import spmi.core.manageables as manageables_package
-from spmi.utils.load import load_class_from_package
+from spmi.utils.load import load_class_from_package, get_class_name
 from spmi.utils.metadata import MetaData, MetaDataError
 from spmi.utils.logger import Logger
-from spmi.utils.io.io import Io
 from spmi.utils.exception import SpmiException
 
 
@@ -29,7 +29,7 @@ def manageable(cls):
 
     Note:
         Sets ``__old_init__`` attribute of class and
-        ``_metadata`` and ``_metadata._outer_object`` of object.
+        ``_metadata`` of object.
 
     Raises:
         :class:`AttributeError`
@@ -43,7 +43,6 @@ def manageable(cls):
 
         if "_metadata" not in dir(self):
             self._metadata = cls.MetaDataHelper(data=data, meta=meta, **kwargs)
-            self._metadata._outer_object = self
 
         self._logger.debug(f'Creating "{self.state.id}"')
 
@@ -76,6 +75,8 @@ class Manageable(metaclass=ABCMeta):
     """
 
     class MetaDataHelper(MetaData):
+        __slots__ = ()
+
         _DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 
         @property
@@ -152,12 +153,7 @@ class Manageable(metaclass=ABCMeta):
                 :class:`MetaDataError`
                 :class:`TypeError`
             """
-            if "path" in self._meta:
-                res = self._meta["path"]
-                if not res is None:
-                    res = Path(res)
-                return res
-            return None
+            return self._get_path("path")
 
         @path.setter
         def path(self, value):
@@ -253,6 +249,41 @@ class Manageable(metaclass=ABCMeta):
         META_FILENAME = "meta"
         """:obj:`str`: name of meta file (without extention)"""
 
+        @staticmethod
+        def _pathes(path, filename):
+            """Return all files named ``filename`` with any extention.
+
+            Walks ``path`` recursively with :func:`os.scandir`, names are
+            checked before file type, so most entries cost no ``stat``.
+            Hidden entries and ``.lock`` files are skipped by name.
+            Like :meth:`pathlib.Path.rglob`, symlinks to directories are
+            not followed.
+
+            Args:
+                path (:obj:`pathlib.Path`): Directory path.
+                filename (:obj:`str`): File name without extention.
+
+            Returns:
+                :obj:`list` of :obj:`pathlib.Path`.
+            """
+            prefix = filename + "."
+            result = []
+            stack = [path]
+            while stack:
+                try:
+                    with os.scandir(stack.pop()) as entries:
+                        for entry in entries:
+                            name = entry.name
+                            if name.startswith(".") or name.endswith(".lock"):
+                                continue
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                            elif name.startswith(prefix) and entry.is_file():
+                                result.append(Path(entry.path))
+                except PermissionError:
+                    pass
+            return result
+
         @staticmethod
         def data_pathes(path):
             """Return all potential data pathes.
@@ -263,11 +294,8 @@ class Manageable(metaclass=ABCMeta):
             Returns:
                 :obj:`list` of :obj:`pathlib.Path`.
             """
-            return list(
-                filter(
-                    lambda x: x.is_file() and ".lock" not in x.suffix,
-                    path.rglob(Manageable.FileSystemHelper.DATA_FILENAME + ".*"),
-                )
+            return Manageable.FileSystemHelper._pathes(
+                path, Manageable.FileSystemHelper.DATA_FILENAME
             )
 
         @staticmethod
@@ -280,11 +308,8 @@ class Manageable(metaclass=ABCMeta):
             Returns:
                 :obj:`list` of :obj:`pathlib.Path`.
             """
-            return list(
-                filter(
-                    lambda x: x.is_file() and ".lock" not in x.suffix,
-                    path.rglob(Manageable.FileSystemHelper.META_FILENAME + ".*"),
-                )
+            return Manageable.FileSystemHelper._pathes(
+                path, Manageable.FileSystemHelper.META_FILENAME
             )
 
         @staticmethod
@@ -475,7 +500,7 @@ class Manageable(metaclass=ABCMeta):
                 raise TypeError(f"name must be a str, not {type(name)}")
 
             return load_class_from_package(
-                "".join([x.capitalize() for x in name.split()]) + "Manageable",
+                get_class_name(name, "Manageable"),
                 manageables_package,
             )
 
@@ -537,6 +562,9 @@ class Manageable(metaclass=ABCMeta):
 
             return manageable
 
+    _STATUS_LABELS = ("Active", "Path")
+    _STATUS_ALIGN = max(map(len, _STATUS_LABELS))
+
     @abstractmethod
     def __init__(self, data=None, meta=None):
         """
@@ -562,6 +590,39 @@ class Manageable(metaclass=ABCMeta):
             raise ManageableException("Must be inactive")
         self._metadata.reset()
 
+    @classmethod
+    def refresh_many(cls, manageables):
+        """Reloads state shared by several manageables of this class.
+
+        Called before checking statuses of many manageables.
+        Default implementation does nothing.
+
+        Args:
+            manageables (:obj:`list` of :class:`Manageable`): Manageables.
+        """
+
+    @classmethod
+    def start_many(cls, manageables):
+        """Starts several manageables of this class.
+
+        Manageables must be entered. Default implementation starts
+        them one by one, subclasses may start them together.
+
+        Args:
+            manageables (:obj:`list` of :class:`Manageable`): Manageables.
+
+        Returns:
+            :obj:`list` of :obj:`tuple`: Manageables failed to start
+            and raised exceptions.
+        """
+        failed = []
+        for manageable in manageables:
+            try:
+                manageable.start()
+            except SpmiException as e:
+                failed.append((manageable, e))
+        return failed
+
     @abstractmethod
     def term(self):
         """Terminate this manageable.
@@ -634,44 +695,37 @@ class Manageable(metaclass=ABCMeta):
         Args:
             align (:obj:`int`): Align.
         """
-        align = max(
-            align,
-            max(map(
-                lambda x: len(x),
-                [
-                    "Active",
-                    "Path",
-                ],
-            ))
-        )
+        align = max(align, self._STATUS_ALIGN)
 
         state = self.state
-        result = ""
-        result += f"{state.id} ({state.type}) - {state.comment}\n"
-
-        active_info = ""
-        if self.status == ManageableStatus.ACTIVE:
-            active_info += "\x1b[32;20mactive\x1b[0m"
-            active_info += f" since {self._metadata.start_time}"
-            td = datetime.now() - self._metadata.start_time
+        header = f"{state.id} ({state.type}) - {state.comment}\n"
+
+        status = self.status
+        if status == ManageableStatus.ACTIVE:
+            start_time = self._metadata.start_time
+            td = datetime.now() - start_time
             td = td - timedelta(microseconds=td.microseconds)
-            active_info += f" ({td} ago)"
-        elif self.status == ManageableStatus.INACTIVE:
-            active_info += "\x1b[31;20minactive\x1b[0m"
-            if self._metadata.finish_time:
-                active_info += f" since {self._metadata.finish_time}"
-                td = datetime.now() - self._metadata.finish_time
+            active_info = f"\x1b[32;20mactive\x1b[0m since {start_time} ({td} ago)"
+        elif status == ManageableStatus.INACTIVE:
+            finish_time = self._metadata.finish_time
+            if finish_time:
+                td = datetime.now() - finish_time
                 td = td - timedelta(microseconds=td.microseconds)
-                active_info += f" ({td} ago)"
+                active_info = (
+                    f"\x1b[31;20minactive\x1b[0m since {finish_time} ({td} ago)"
+                )
             else:
-                active_info += " (no finish time)"
+                active_info = "\x1b[31;20minactive\x1b[0m (no finish time)"
         else:
-            return result
-
-        result += f"{{:>{align}}}: {{:}}\n".format("Active", active_info)
-        result += f'{{:>{align}}}: "{{:}}"\n'.format("Path", state.path)
-
-        return result
+            return header
+
+        return "".join(
+            [
+                header,
+                f"{{:>{align}}}: {{:}}\n".format("Active", active_info),
+                f'{{:>{align}}}: "{{:}}"\n'.format("Path", state.path),
+            ]
+        )
 
     @property
     @abstractmethod
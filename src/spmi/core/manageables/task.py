@@ -3,18 +3,88 @@
 
 import os
 import sys
+import shlex
 import signal
+import time
+import subprocess
 import logging
+import importlib
+from functools import lru_cache
 from datetime import datetime
 from pathlib import Path
-from subprocess import check_output
 from abc import ABCMeta, abstractmethod
-import spmi.core.manageables.task_.wrappers as wrappers_package
-import spmi.core.manageables.task_.backends as backends_package
 from spmi.core.manageable import Manageable, manageable, ManageableException, ManageableStatus
 from spmi.utils.metadata import MetaDataNode, MetaDataError, dontcheck
-from spmi.utils.load import load_class_from_package
+from spmi.utils.load import package_modules, get_class_name
 from spmi.utils.logger import Logger
+from spmi.utils.exception import SpmiException
+
+
+_BACKEND_CLASSES = {}
+""":obj:`dict`: Backend classes by their names, filled on subclassing."""
+
+_WRAPPER_CLASSES = {}
+""":obj:`dict`: Wrapper classes by their names, filled on subclassing."""
+
+_BACKENDS_PACKAGE = "spmi.core.manageables.task_.backends"
+""":obj:`str`: Name of package with backends."""
+
+_WRAPPERS_PACKAGE = "spmi.core.manageables.task_.wrappers"
+""":obj:`str`: Name of package with wrappers."""
+
+_INTERPRETER = (sys.executable,) if sys.executable else ("/usr/bin/env", "python3")
+""":obj:`tuple` of :obj:`str`: Command running current Python interpreter."""
+
+_RUNNER_MODULE = "spmi.core.manageables.task_"
+""":obj:`str`: Name of module run by wrapper command."""
+
+
+def _registered_class(registry, typename, suffix, package):
+    """Returns class by type name from ``registry``.
+
+    If the class is not registered, imports ``package`` module named
+    after the type (e.g. ``screen`` for ``"screen"`` backend), so its
+    classes register themselves. If it is not found there, other
+    modules are imported one by one until the class is registered.
+    Modules which cannot be imported are skipped.
+
+    Args:
+        registry (:obj:`dict`): Registered classes.
+        typename (:obj:`str`): Type name.
+        suffix (:obj:`str`): Classname suffix.
+        package (:obj:`str`): Name of package to load classes from.
+
+    Returns:
+        :obj:`class`.
+
+    Raises:
+        :class:`NotImplementedError`
+    """
+    classname = get_class_name(typename, suffix)
+    try:
+        return registry[classname]
+    except KeyError:
+        pass
+
+    mname = typename.replace(" ", "_").lower()
+    try:
+        importlib.import_module(f"{package}.{mname}")
+    except ImportError:
+        pass
+    if classname in registry:
+        return registry[classname]
+
+    for name in package_modules(importlib.import_module(package)):
+        if name == mname:
+            continue
+        try:
+            importlib.import_module(f"{package}.{name}")
+        except ImportError:
+            continue
+        if classname in registry:
+            return registry[classname]
+
+    raise NotImplementedError(f'Cannot find "{classname}" in {package}')
 
 
 class TaskManageableException(ManageableException):
@@ -50,6 +120,47 @@ class TaskManageable(Manageable):
     """
 
     class MetaDataHelper(Manageable.MetaDataHelper):
+        __slots__ = (
+            "_backend_class",
+            "_wrapper_class",
+            "_backend_node",
+            "_wrapper_node",
+            "_common_backend_node",
+            "_common_wrapper_node",
+        )
+
+        def __init__(self, *args, metadata=None, **kwargs):
+            # Backend and wrapper classes depend only on data,
+            # so reuse ones already resolved by the copied object.
+            if isinstance(metadata, TaskManageable.MetaDataHelper):
+                for name in ("_backend_class", "_wrapper_class"):
+                    if hasattr(metadata, name):
+                        setattr(self, name, getattr(metadata, name))
+            super().__init__(*args, metadata=metadata, **kwargs)
+
+        def _cached_node(self, name, key, build):
+            """Returns a node cached in ``name`` attribute.
+
+            The node is rebuilt with ``build`` if meta or data dictionary
+            of ``key`` section has been replaced (e.g. by :meth:`load`).
+
+            Args:
+                name (:obj:`str`): Attribute name to store the node.
+                key (:obj:`str`): Section key.
+                build (:obj:`callable`): Node factory.
+
+            Returns:
+                :obj:`spmi.utils.metadata.MetaDataNode`.
+            """
+            meta = self._meta.get(key)
+            data = self.m_data.get(key)
+            cached = getattr(self, name, None)
+            if cached and cached[0] is meta and cached[1] is data:
+                return cached[2]
+            node = build()
+            setattr(self, name, (self._meta[key], self.m_data[key], node))
+            return node
+
         def _backend(self, cls):
             if "backend" not in self.m_data:
                 raise ValueError('Data should contain "backend" dictionary')
@@ -77,11 +188,23 @@ class TaskManageable(Manageable):
             """
             if not hasattr(self, "_backend_class"):
                 self._backend_class = TaskManageable.Backend.get_backend_class(self)
-            return self._backend(self._backend_class)
+            return self._cached_node(
+                "_backend_node", "backend", lambda: self._backend(self._backend_class)
+            )
 
         @property
         def common_backend(self):
-            return self._backend(TaskManageable.Backend)
+            """:obj:`TaskManageable.Backend.MetaDataHelper`: Backend data
+            without backend specific fields.
+
+            Raises:
+                :class:`ValueError`
+            """
+            return self._cached_node(
+                "_common_backend_node",
+                "backend",
+                lambda: self._backend(TaskManageable.Backend),
+            )
 
         def _wrapper(self, cls):
             if "wrapper" not in self.m_data:
@@ -110,11 +233,23 @@ class TaskManageable(Manageable):
             """
             if not hasattr(self, "_wrapper_class"):
                 self._wrapper_class = TaskManageable.Wrapper.get_wrapper_class(self)
-            return self._wrapper(self._wrapper_class)
+            return self._cached_node(
+                "_wrapper_node", "wrapper", lambda: self._wrapper(self._wrapper_class)
+            )
 
         @property
         def common_wrapper(self):
-            return self._wrapper(TaskManageable.Wrapper)
+            """:obj:`TaskManageable.Wrapper.MetaDataHelper`: Wrapper data
+            without wrapper specific fields.
+
+            Raises:
+                :class:`ValueError`
+            """
+            return self._cached_node(
+                "_common_wrapper_node",
+                "wrapper",
+                lambda: self._wrapper(TaskManageable.Wrapper),
+            )
 
         def reset(self):
             super().reset()
@@ -129,9 +264,15 @@ class TaskManageable(Manageable):
         Its name should be written in PascalCase and ended with "Backend".
         """
 
+        def __init_subclass__(cls, **kwargs):
+            super().__init_subclass__(**kwargs)
+            _BACKEND_CLASSES[cls.__name__] = cls
+
         class MetaDataHelper(MetaDataNode):
             """Provides access to data."""
 
+            __slots__ = ()
+
             @property
             def type(self):
                 """:obj:`str`. Backend type."""
@@ -145,9 +286,7 @@ class TaskManageable(Manageable):
                     :class:`TypeError`
                     :class:`MetaDataError`
                 """
-                if "id" in self._meta:
-                    return self._meta["id"]
-                return None
+                return self._meta.get("id")
 
             @id.setter
             def id(self, value):
@@ -171,9 +310,7 @@ class TaskManageable(Manageable):
                     :class:`TypeError`
                     :class:`MetaDataError`
                 """
-                if "start_command" in self._meta:
-                    return self._meta["start_command"]
-                return None
+                return self._meta.get("start_command")
 
             @command.setter
             def command(self, value):
@@ -199,9 +336,7 @@ class TaskManageable(Manageable):
                     :class:`TypeError`
                     :class:`MetaDataError`
                 """
-                if "log_path" in self._meta and self._meta["log_path"]:
-                    return Path(self._meta["log_path"])
-                return None
+                return self._get_path("log_path")
 
             @log_path.setter
             def log_path(self, value):
@@ -211,15 +346,15 @@ class TaskManageable(Manageable):
                     raise TypeError(
                         f"value must be None or pathlib.Path, not {type(value)}"
                     )
-                self._meta["log_path"] = None if value is None else str(value.resolve())
+                self._set_path("log_path", value)
 
             @log_path.deleter
             def log_path(self):
                 if not self.mutable:
                     raise MetaDataError("Must be mutable")
                 assert "log_path" in self._meta
-                if self.log_path.exists():
-                    self.log_path.unlink()
+                if self.log_path:
+                    self.log_path.unlink(missing_ok=True)
                 del self._meta["log_path"]
 
             def reset(self):
@@ -240,12 +375,117 @@ class TaskManageable(Manageable):
 
             Raises:
                 :class:`BackendException`
-                :class:`TypeError`
             """
-            if not isinstance(task_metadata, TaskManageable.MetaDataHelper):
-                raise TypeError(
-                    f"task_metadata must be a TaskManageable.MetaDataHelper, not {type(task_metadata)}"
-                )
+            assert isinstance(task_metadata, TaskManageable.MetaDataHelper)
+
+        @classmethod
+        def refresh(cls):
+            """Reloads state of backend jobs shared by backend objects.
+
+            Pollers may call it once per iteration before checking
+            many tasks. Default implementation does nothing.
+
+            Raises:
+                :class:`BackendException`
+            """
+
+        JOBS_TTL = 0.0
+        """:obj:`float`: Time in seconds to reuse loaded job IDs."""
+
+        EXCEPTION = BackendException
+        """:obj:`type`: Exception raised by backend helpers."""
+
+        _loaded_job_ids = None
+        _loaded_time = 0.0
+
+        @classmethod
+        def _list_jobs(cls):
+            """Lists IDs of all jobs.
+
+            Backends which use :meth:`load_jobs_once` should
+            override it.
+
+            Returns:
+                :obj:`list` of :obj:`str`.
+
+            Raises:
+                :class:`BackendException`
+            """
+            raise NotImplementedError
+
+        @classmethod
+        def load_jobs_once(cls, force=False):
+            """Returns IDs of all jobs.
+
+            Lists jobs only if the IDs loaded before are older
+            than :attr:`JOBS_TTL` seconds, so many tasks polled in a row
+            cost one process spawn. Loaded IDs are shared by all
+            objects of the backend class.
+
+            Args:
+                force (:obj:`bool`): If ``True``, lists jobs anyway.
+
+            Returns:
+                :obj:`frozenset` of :obj:`str`.
+
+            Raises:
+                :class:`BackendException`
+            """
+            now = time.monotonic()
+            if (
+                not force
+                and cls._loaded_job_ids is not None
+                and now - cls._loaded_time < cls.JOBS_TTL
+            ):
+                return cls._loaded_job_ids
+
+            job_ids = cls._list_jobs()
+            result = frozenset(job_ids)
+
+            if len(result) != len(job_ids):
+                raise cls.EXCEPTION(f"Found equal IDs of {cls.__name__} jobs")
+
+            cls._loaded_job_ids = result
+            cls._loaded_time = now
+            return result
+
+        @classmethod
+        def _invalidate_jobs(cls):
+            """Makes next :meth:`load_jobs_once` call list jobs."""
+            cls._loaded_job_ids = None
+
+        @classmethod
+        def _run(cls, args):
+            """Runs a command without a shell.
+
+            Args:
+                args (:obj:`list` of :obj:`str`): Command arguments.
+
+            Returns:
+                :obj:`int`: Exit code.
+
+            Raises:
+                :class:`BackendException`
+            """
+            try:
+                return subprocess.run(args, check=False).returncode
+            except OSError as e:
+                raise cls.EXCEPTION(f'Cannot run "{args[0]}":\n{e}') from e
+
+        def submit_many(self, task_metadatas):
+            """Submits several commands.
+
+            Default implementation calls :meth:`submit` for each metadata,
+            backends may override it to start jobs concurrently.
+
+            Args:
+                task_metadatas (:obj:`list` of :obj:`TaskManageable.MetaDataHelper`): Metadatas.
+
+            Raises:
+                :class:`BackendException`
+            """
+            for task_metadata in task_metadatas:
+                self.submit(task_metadata)
 
         @abstractmethod
         def term(self, task_metadata):
@@ -259,12 +499,8 @@ class TaskManageable(Manageable):
 
             Raises:
                 :class:`BackendException`
-                :class:`TypeError`
             """
-            if not isinstance(task_metadata, TaskManageable.MetaDataHelper):
-                raise TypeError(
-                    f"task_metadata must be a TaskManageable.MetaDataHelper, not {type(task_metadata)}"
-                )
+            assert isinstance(task_metadata, TaskManageable.MetaDataHelper)
 
         @abstractmethod
         def kill(self, task_metadata):
@@ -278,12 +514,8 @@ class TaskManageable(Manageable):
 
             Raises:
                 :class:`BackendException`
-                :class:`TypeError`
             """
-            if not isinstance(task_metadata, TaskManageable.MetaDataHelper):
-                raise TypeError(
-                    f"task_metadata must be a TaskManageable.MetaDataHelper, not {type(task_metadata)}"
-                )
+            assert isinstance(task_metadata, TaskManageable.MetaDataHelper)
 
         @abstractmethod
         def is_active(self, task_metadata):
@@ -297,19 +529,17 @@ class TaskManageable(Manageable):
 
             Raises:
                 :class:`BackendException`
-                :class:`TypeError`
             """
-            if not isinstance(task_metadata, TaskManageable.MetaDataHelper):
-                raise TypeError(
-                    f"task_metadata must be a TaskManageable.MetaDataHelper, not {type(task_metadata)}"
-                )
+            assert isinstance(task_metadata, TaskManageable.MetaDataHelper)
 
         @staticmethod
         def get_backend_class(metadata):
-            """Returns wrapper class by metadata"""
-            return load_class_from_package(
-                "".join([x.capitalize() for x in metadata.common_backend.type.split()]) + "Backend",
-                backends_package,
+            """Returns backend class by metadata"""
+            return _registered_class(
+                _BACKEND_CLASSES,
+                metadata.common_backend.type,
+                "Backend",
+                _BACKENDS_PACKAGE,
             )
 
     class Wrapper(metaclass=ABCMeta):
@@ -320,12 +550,18 @@ class TaskManageable(Manageable):
         Its name should be written in PascalCase and ended with "Wrapper".
         """
 
+        def __init_subclass__(cls, **kwargs):
+            super().__init_subclass__(**kwargs)
+            _WRAPPER_CLASSES[cls.__name__] = cls
+
         @abstractmethod
         def __init__(self, metadata=None):
             self._logger = Logger(self.__class__.__name__)
             self._metadata = metadata
 
         class MetaDataHelper(MetaDataNode):
+            __slots__ = ()
+
             @property
             def type(self) -> str:
                 """:obj:`str`: Wrapper type."""
@@ -356,9 +592,7 @@ class TaskManageable(Manageable):
                     :class:`MetaDataError`
                     :class:`TypeError`
                 """
-                if "stdout_path" in self._meta and self._meta["stdout_path"]:
-                    return Path(self._meta["stdout_path"])
-                return None
+                return self._get_path("stdout_path")
 
             @stdout_path.setter
             def stdout_path(self, value):
@@ -368,17 +602,15 @@ class TaskManageable(Manageable):
                     raise TypeError(
                         f"value must be None or pathlib.Path, not {type(value)}"
                     )
-                self._meta["stdout_path"] = (
-                    None if value is None else str(value.resolve())
-                )
+                self._set_path("stdout_path", value)
 
             @stdout_path.deleter
             def stdout_path(self):
                 if not self.mutable:
                     raise MetaDataError("Must be mutable")
                 assert "stdout_path" in self._meta
-                if self.stdout_path.exists():
-                    self.stdout_path.unlink()
+                if self.stdout_path:
+                    self.stdout_path.unlink(missing_ok=True)
                 del self._meta["stdout_path"]
 
             @dontcheck
@@ -393,9 +625,7 @@ class TaskManageable(Manageable):
                 """
                 if self.mixed_stdout:
                     return self.stdout_path
-                if "stderr_path" in self._meta and self._meta["stderr_path"]:
-                    return Path(self._meta["stderr_path"])
-                return None
+                return self._get_path("stderr_path")
 
             @stderr_path.setter
             def stderr_path(self, value):
@@ -405,17 +635,15 @@ class TaskManageable(Manageable):
                     raise TypeError(
                         f"value must be None or pathlib.Path, not {type(value)}"
                     )
-                self._meta["stderr_path"] = (
-                    None if value is None else str(value.resolve())
-                )
+                self._set_path("stderr_path", value)
 
             @stderr_path.deleter
             def stderr_path(self):
                 if not self.mutable:
                     raise MetaDataError("Must be mutable")
                 assert "stderr_path" in self._meta
-                if self.stderr_path.exists():
-                    self.stderr_path.unlink()
+                if self.stderr_path:
+                    self.stderr_path.unlink(missing_ok=True)
                 del self._meta["stderr_path"]
 
             @dontcheck
@@ -428,9 +656,7 @@ class TaskManageable(Manageable):
                     :class:`MetaDataError`
                     :class:`TypeError`
                 """
-                if "stdin_path" in self._meta and self._meta["stdin_path"]:
-                    return Path(self._meta["stdin_path"])
-                return None
+                return self._get_path("stdin_path")
 
             @stdin_path.setter
             def stdin_path(self, value):
@@ -440,9 +666,7 @@ class TaskManageable(Manageable):
                     raise TypeError(
                         f"value must be None or pathlib.Path, not {type(value)}"
                     )
-                self._meta["stdin_path"] = (
-                    None if value is None else str(value.resolve())
-                )
+                self._set_path("stdin_path", value)
 
                 if value:
                     os.mkfifo(value)
@@ -466,9 +690,7 @@ class TaskManageable(Manageable):
                     :class:`MetaDataError`
                     :class:`TypeError`
                 """
-                if "process_pid" in self._meta and self._meta["process_pid"]:
-                    return self._meta["process_pid"]
-                return None
+                return self._meta.get("process_pid") or None
 
             @process_pid.setter
             def process_pid(self, value):
@@ -493,9 +715,7 @@ class TaskManageable(Manageable):
                     :class:`MetaDataError`
                     :class:`TypeError`
                 """
-                if "exit_code" in self._meta and not self._meta["exit_code"] is None:
-                    return self._meta["exit_code"]
-                return None
+                return self._meta.get("exit_code")
 
             @exit_code.setter
             def exit_code(self, value):
@@ -534,9 +754,11 @@ class TaskManageable(Manageable):
         @staticmethod
         def get_wrapper_class(metadata):
             """Returns wrapper class by metadata"""
-            return load_class_from_package(
-                "".join([x.capitalize() for x in metadata.common_wrapper.type.split()]) + "Wrapper",
-                wrappers_package,
+            return _registered_class(
+                _WRAPPER_CLASSES,
+                metadata.common_wrapper.type,
+                "Wrapper",
+                _WRAPPERS_PACKAGE,
             )
 
     class Cli:
@@ -554,25 +776,26 @@ class TaskManageable(Manageable):
 
             Raises:
                 :class:`TypeError`
-                :class:`ValueError`
             """
             if not isinstance(task_metadata, TaskManageable.MetaDataHelper):
                 raise TypeError(
                     f"task_metadata must be a TaskManageable.MetaDataHelper, not {type(task_metadata)}"
                 )
-            if "'" in str(task_metadata.data_path):
-                raise ValueError(
-                    f'Data path "{task_metadata.data_path}" must not contain "\'"'
-                )
-            if "'" in str(task_metadata.meta_path):
-                raise ValueError(
-                    f'Meta path "{task_metadata.meta_path}" must not contain "\'"'
-                )
-            result = f"/usr/bin/env python3 '{__file__}' '{task_metadata.data_path}' '{task_metadata.meta_path}'"
-            if Logger.log_level() == logging.DEBUG:
-                result += " debug"
 
-            return result
+            return TaskManageable.Cli._command(
+                str(task_metadata.data_path),
+                str(task_metadata.meta_path),
+                Logger.log_level() == logging.DEBUG,
+            )
+
+        @staticmethod
+        @lru_cache(maxsize=1024)
+        def _command(data_path, meta_path, debug):
+            args = [*_INTERPRETER, "-m", _RUNNER_MODULE, data_path, meta_path]
+            if debug:
+                args.append("debug")
+
+            return " ".join(map(shlex.quote, args))
 
         @staticmethod
         def from_args():
@@ -582,6 +805,16 @@ class TaskManageable(Manageable):
 
             return TaskManageable.MetaDataHelper(data=datapath, meta=metapath)
 
+    _STATUS_LABELS = (
+        "Backend type",
+        "Backend ID",
+        "Wrapper type",
+        "Command",
+        "PID",
+        "Exit code",
+    )
+    _STATUS_ALIGN = max(map(len, _STATUS_LABELS))
+
     def __init__(self, *args, **kwargs):
         self._backend = TaskManageable.Backend.get_backend_class(self._metadata)()
 
@@ -591,6 +824,45 @@ class TaskManageable(Manageable):
         self._backend.submit(self._metadata)
         self._metadata.start_time = datetime.now()
 
+    @classmethod
+    def refresh_many(cls, manageables):
+        """Refreshes each backend type used by tasks once."""
+        for backend_class in {type(task._backend) for task in manageables}:
+            backend_class.refresh()
+
+    @classmethod
+    def start_many(cls, manageables):
+        """Starts several tasks.
+
+        Tasks with the same backend type are submitted with one
+        :meth:`TaskManageable.Backend.submit_many` call.
+        """
+        failed = []
+        batches = {}
+        for task in manageables:
+            try:
+                Manageable.start(task)
+                task._metadata.backend.command = TaskManageable.Cli.command(
+                    task._metadata
+                )
+            except SpmiException as e:
+                failed.append((task, e))
+                continue
+            batches.setdefault(type(task._backend), (task._backend, []))[1].append(task)
+
+        for backend, tasks in batches.values():
+            try:
+                backend.submit_many([task._metadata for task in tasks])
+            except SpmiException as e:
+                failed.extend((task, e) for task in tasks if not task._metadata.backend.id)
+
+            now = datetime.now()
+            for task in tasks:
+                if task._metadata.backend.id:
+                    task._metadata.start_time = now
+
+        return failed
+
     def term(self):
         super().term()
         self._backend.term(self._metadata)
@@ -618,54 +890,87 @@ class TaskManageable(Manageable):
         Args:
             align (:obj:`int`): Align.
         """
-        align = max(
-            align,
-            max(map(
-                len,
-                [
-                    "Backend type",
-                    "Backend ID",
-                    "Wrapper type",
-                    "Command",
-                    "PID",
-                    "Exit code",
-                ],
-            ))
-        )
+        align = max(align, self._STATUS_ALIGN)
 
         state = self.state
-        result = super().status_string(align=align)
-        result += f"{{:>{align}}}: {{:}}\n".format("Backend type", state.backend.type)
-        if state.backend.id:
-            result += f"{{:>{align}}}: {{:}}\n".format("Backend ID", state.backend.id)
-        result += f"{{:>{align}}}: {{:}}\n".format("Wrapper type", state.wrapper.type)
-        result += f"{{:>{align}}}: {{:}}\n".format("Command", state.wrapper.command)
-        if isinstance(state.wrapper.process_pid, int):
-            result += f"{{:>{align}}}: {{:}}\n".format("PID", state.wrapper.process_pid)
-        if isinstance(state.wrapper.exit_code, int):
-            result += f"{{:>{align}}}: {{:}}\n".format(
-                "Exit code", state.wrapper.exit_code
-            )
-
-        if isinstance(state.wrapper.stdout_path, Path):
-            result += "\n"
-            result += check_output(f"tail -5 {state.wrapper.stdout_path}", shell=True).decode(encoding="utf-8")
-            result += "\n"
-
-        return result
+        backend = state.backend
+        wrapper = state.wrapper
+        line = f"{{:>{align}}}: {{:}}\n"
+
+        lines = [super().status_string(align=align)]
+        lines.append(line.format("Backend type", backend.type))
+        if backend.id:
+            lines.append(line.format("Backend ID", backend.id))
+        lines.append(line.format("Wrapper type", wrapper.type))
+        lines.append(line.format("Command", wrapper.command))
+        if isinstance(wrapper.process_pid, int):
+            lines.append(line.format("PID", wrapper.process_pid))
+        if isinstance(wrapper.exit_code, int):
+            lines.append(line.format("Exit code", wrapper.exit_code))
+
+        if isinstance(wrapper.stdout_path, Path):
+            lines.append("\n")
+            lines.append(_tail(wrapper.stdout_path, 5))
+            lines.append("\n")
+
+        return "".join(lines)
+
+
+def _tail(path, count, block_size=4096):
+    """Returns last lines of file.
+
+    Reads the file backwards by blocks until enough lines are found,
+    so only the end of a large file is read.
+
+    Args:
+        path (:obj:`pathlib.Path`): Path to file.
+        count (:obj:`int`): Number of lines.
+        block_size (:obj:`int`): Size of read block in bytes.
+
+    Returns:
+        :obj:`str`.
+    """
+    with open(path, "rb") as f:
+        position = f.seek(0, os.SEEK_END)
+        buffer = b""
+        # one more line break is needed if the file ends with it
+        while position > 0 and buffer.count(b"\n") <= count:
+            size = min(block_size, position)
+            position -= size
+            f.seek(position)
+            buffer = f.read(size) + buffer
+
+    # lines are split only by "\n", like "tail -n" does
+    lines = buffer.split(b"\n")
+    end = b""
+    if buffer.endswith(b"\n"):
+        lines.pop()
+        end = b"\n"
+
+    return (b"\n".join(lines[-count:]) + end).decode(
+        encoding="utf-8", errors="replace"
+    )
+
+
+_SETTABLE_SIGNALS = frozenset(
+    s
+    for s in signal.valid_signals()
+    if isinstance(s, signal.Signals) and s not in (signal.SIGKILL, signal.SIGSTOP)
+)
+""":obj:`frozenset` of :obj:`signal.Signals`: Signals which handlers can be set."""
 
 
 def set_signal_handlers(wrapper):
     """Sets signal handlers."""
-    for i in filter(lambda x: x.startswith("SIG"), dir(signal)):
+    for signum in _SETTABLE_SIGNALS:
         try:
-            signum = getattr(signal, i)
             signal.signal(signum, wrapper.on_signal)
-        except (OSError, ValueError):
+        except (OSError, ValueError, RuntimeError):
             continue
 
 
-if __name__ == "__main__":
+def main():
+    """Starts wrapper by command line arguments."""
     Logger.basic_config(loglevel="DEBUG" if "debug" in sys.argv else "INFO")
     metadata = TaskManageable.Cli.from_args()
     wrapper = TaskManageable.Wrapper.get_wrapper_class(metadata)(metadata=metadata)
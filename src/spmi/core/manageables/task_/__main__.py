@@ -0,0 +1,11 @@
+"""Runs wrapper of a task.
+
+Executed by command of :class:`spmi.core.manageables.task.TaskManageable.Cli`
+as ``python -m spmi.core.manageables.task_``, so that
+:mod:`spmi.core.manageables.task` is imported as a regular module.
+"""
+
+from spmi.core.manageables.task import main
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,19 @@
 """Provides :class:`ScreenBackend`.
 """
 
-import os
+import re
+import shlex
 import subprocess
 from spmi.core.manageables.task import TaskManageable, BackendException
 from spmi.utils.logger import Logger
 
 
+# based on code from
+# https://github.com/Christophe31/screenutils
+_SCREEN_LINE = re.compile(rb"^[ \t]*(\d+)\.([^\t\n]+)\t", re.MULTILINE)
+""":obj:`re.Pattern`: Matches a session line of ``screen -ls``, captures its ID and name."""
+
+
 class ScreenBackendException(BackendException):
     pass
 
@@ -14,64 +21,176 @@ class ScreenBackendException(BackendException):
 class ScreenBackend(TaskManageable.Backend):
     """GNU Screen backend."""
 
+    JOBS_TTL = 0.25
+    """:obj:`float`: Time in seconds to reuse loaded screen IDs."""
+
+    EXCEPTION = ScreenBackendException
+
     def __init__(self):
         self._logger = Logger(self.__class__.__name__)
         self._logger.debug("Creating backend")
-        self._screen_ids = set()
+        self._screen_ids = frozenset()
         self.load_screens()
 
-    def load_screens(self):
-        """Loads all screen sessions."""
-        self._logger.debug("Loading IDs of screens")
+    def load_screens(self, force=False):
+        """Loads all screen sessions.
+
+        Args:
+            force (:obj:`bool`): If ``True``, runs ``screen -ls`` anyway.
+
+        Returns:
+            :obj:`frozenset` of :obj:`str`: Loaded IDs.
+
+        Raises:
+            :class:`ScreenBackendException`
+        """
+        self._screen_ids = self.load_jobs_once(force=force)
+        self._logger.debug(f"Loaded {len(self._screen_ids)} IDs")
+        return self._screen_ids
 
-        # modified code from
-        # https://github.com/Christophe31/screenutils
-        screen_ids = [
-            l.split(".")[0].strip()
-            for l in subprocess.getoutput("screen -ls").split("\n")
-            if "\t" in l and ".".join(l.split(".")[1:]).split("\t")[0]
+    @classmethod
+    def _list_jobs(cls):
+        return [i for i, _ in cls._list_sessions()]
+
+    @classmethod
+    def refresh(cls):
+        cls.load_jobs_once(force=True)
+
+    @staticmethod
+    def _list_sessions(name=None):
+        """Runs ``screen -ls``.
+
+        Output is parsed as bytes, only IDs and names are decoded.
+
+        Args:
+            name (:obj:`Union[str, None]`): If given, lists only sessions
+                with names starting with it.
+
+        Returns:
+            :obj:`list` of :obj:`tuple`: IDs and names of sessions.
+        """
+        args = ["screen", "-ls"] if name is None else ["screen", "-ls", name]
+        try:
+            output = subprocess.run(args, capture_output=True, check=False).stdout
+        except OSError:
+            output = b""
+
+        return [
+            (screen_id.decode(), name.decode(errors="replace"))
+            for screen_id, name in _SCREEN_LINE.findall(output)
         ]
 
-        self._screen_ids = set(screen_ids)
+    @staticmethod
+    def _session_name(task_metadata):
+        """:obj:`str`: Name of screen session of task."""
+        return f"SPMI screen {task_metadata.id}"
 
-        if len(self._screen_ids) != len(screen_ids):
-            raise ScreenBackendException('Found equal IDs in "screen -ls"')
+    def _submit_args(self, task_metadata):
+        """Prepares metadata and returns arguments to start a screen.
 
-        self._logger.debug(f"Loaded {len(screen_ids)} IDs")
+        Args:
+            task_metadata (:obj:`TaskManageable.MetaDataHelper`): Metadata.
+
+        Returns:
+            :obj:`list` of :obj:`str`.
+        """
+        task_metadata.backend.log_path = task_metadata.path.joinpath("backend.log")
+
+        return [
+            "screen",
+            "-L",
+            "-Logfile",
+            str(task_metadata.backend.log_path),
+            "-dmS",
+            self._session_name(task_metadata),
+            *shlex.split(task_metadata.backend.command),
+        ]
 
     def submit(self, task_metadata):
         super().submit(task_metadata)
         self._logger.debug("Submitting a new task")
 
-        task_metadata.backend.log_path = task_metadata.path.joinpath("backend.log")
+        args = self._submit_args(task_metadata)
+        name = self._session_name(task_metadata)
 
-        self.load_screens()
-        old_ids = self._screen_ids
+        # sessions with this name may be left from previous runs
+        old_ids = {i for i, n in self._list_sessions(name) if n == name}
 
-        if (
-            os.system(
-                f"screen -L -Logfile '{task_metadata.backend.log_path}' -dmS 'SPMI screen {task_metadata.id}' {task_metadata.backend.command}"
-            )
-            != 0
-        ):
+        if self._run(args) != 0:
             raise ScreenBackendException("Cannot start screen")
+        self._invalidate_jobs()
 
-        self.load_screens()
+        new_ids = [
+            i for i, n in self._list_sessions(name) if n == name and i not in old_ids
+        ]
 
-        if len(old_ids) + 1 != len(self._screen_ids):
+        if len(new_ids) != 1:
             raise ScreenBackendException("New screen is not started")
 
-        screen_id = list(self._screen_ids - old_ids)[0]
+        screen_id = new_ids[0]
         task_metadata.backend.id = screen_id
 
         self._logger.debug(f"New screen ID: {screen_id}")
 
+    def submit_many(self, task_metadatas):
+        """Starts screens of all tasks concurrently.
+
+        All ``screen`` processes are spawned before waiting for any
+        of them, then a single ``screen -ls`` call binds the new
+        sessions to tasks by their names.
+        """
+        task_metadatas = list(task_metadatas)
+        for task_metadata in task_metadatas:
+            TaskManageable.Backend.submit(self, task_metadata)
+        self._logger.debug(f"Submitting {len(task_metadatas)} new tasks")
+
+        old_ids = self.load_screens(force=True)
+
+        # screens which did start must still be bound, so spawn
+        # failures are collected instead of raised
+        processes = []
+        for task_metadata in task_metadatas:
+            try:
+                process = subprocess.Popen(self._submit_args(task_metadata))
+            except OSError as e:
+                self._logger.warning(
+                    f'Cannot run "screen" for "{task_metadata.id}":\n{e}'
+                )
+                process = None
+            processes.append(process)
+
+        failed = [
+            task_metadata.id
+            for task_metadata, process in zip(task_metadatas, processes)
+            if process is None or process.wait() != 0
+        ]
+        self._invalidate_jobs()
+
+        new_ids = {}
+        for screen_id, name in self._list_sessions():
+            if screen_id not in old_ids:
+                new_ids.setdefault(name, []).append(screen_id)
+
+        for task_metadata in task_metadatas:
+            if task_metadata.id in failed:
+                continue
+            ids = new_ids.get(self._session_name(task_metadata), [])
+            if len(ids) != 1:
+                failed.append(task_metadata.id)
+                continue
+            task_metadata.backend.id = ids[0]
+            self._logger.debug(f"New screen ID: {ids[0]}")
+
+        if failed:
+            raise ScreenBackendException(
+                "Cannot start screens of " + ", ".join(f'"{x}"' for x in failed)
+            )
+
     def _send(self, task_metadata, message):
         if not isinstance(message, str):
             raise TypeError(f'message must be str, not "{type(message)}"')
 
         self._logger.debug(f'Sending "{message}" to screen {task_metadata.backend.id}')
-        self.load_screens()
 
         screen_id = task_metadata.backend.id
 
@@ -80,17 +199,19 @@ class ScreenBackend(TaskManageable.Backend):
                 f'Attempting to operate on not existing screen "{screen_id}"'
             )
 
-        command = f"screen -x {screen_id} -X {message}"
-        if os.system(command) != 0:
-            raise ScreenBackendException(f'Command  "{command}" failed')
+        args = ["screen", "-x", screen_id, "-X", *shlex.split(message)]
+        if self._run(args) != 0:
+            raise ScreenBackendException(f'Command  "{shlex.join(args)}" failed')
 
     def term(self, task_metadata):
         super().term(task_metadata)
         self._send(task_metadata, "stuff '^C'")
+        self._invalidate_jobs()
 
     def kill(self, task_metadata):
         super().kill(task_metadata)
         self._send(task_metadata, "quit")
+        self._invalidate_jobs()
 
     def is_active(self, task_metadata):
         super().is_active(task_metadata)
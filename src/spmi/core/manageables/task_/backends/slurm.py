@@ -1,7 +1,8 @@
 """Provides :class:`SlurmBackend`.
 """
 
-import os
+import shlex
+import getpass
 import subprocess
 from spmi.core.manageables.task import TaskManageable, BackendException
 from spmi.utils.logger import Logger
@@ -11,37 +12,72 @@ class SlurmBackendException(BackendException):
 
 class SlurmBackend(TaskManageable.Backend):
     class MetaDataHelper(TaskManageable.Backend.MetaDataHelper):
+        __slots__ = ()
+
         @property
         def options(self):
             return list(self._data["options"])
 
     """SLURM backend."""
+
+    JOBS_TTL = 1.0
+    """:obj:`float`: Time in seconds to reuse loaded job IDs."""
+
+    EXCEPTION = SlurmBackendException
+
     def __init__(self):
         raise NotImplementedError("Now Slurm backend is not implemented")
         self._logger = Logger(self.__class__.__name__)
         self._logger.debug("Creating backend")
-        self._job_ids = set()
+        self._job_ids = frozenset()
         self.load_jobs()
 
-    def load_jobs(self):
-        """Loads all job IDs."""
-        self._logger.debug("Loading IDs of jobs")
-
-        job_ids = [x.strip() for x in subprocess.getoutput("squeue -ho \"%A\"").split("\n")]
-
-        self._job_ids = set(job_ids)
-
-        if len(self._job_ids) != len(job_ids):
-            raise SlurmBackendException("Found equal IDs in \"squeue\"")
-
-        self._logger.debug(f"Loaded {len(job_ids)} IDs")
-
-    def _generate_command(self, task_metadata):
-        command = "sbatch "
-        for option in matedata.backend.options:
-            command += f"{option} "
-        command += "'{task_metadata.backend.command}'"
-        return command
+    def load_jobs(self, force=False):
+        """Loads all job IDs.
+
+        Args:
+            force (:obj:`bool`): If ``True``, runs ``squeue`` anyway.
+
+        Returns:
+            :obj:`frozenset` of :obj:`str`: Loaded IDs.
+        """
+        self._job_ids = self.load_jobs_once(force=force)
+        self._logger.debug(f"Loaded {len(self._job_ids)} IDs")
+        return self._job_ids
+
+    @classmethod
+    def _list_jobs(cls):
+        """Runs ``squeue``, only jobs of current user are listed."""
+        try:
+            output = subprocess.run(
+                ["squeue", "-h", "-u", getpass.getuser(), "-o", "%A"],
+                capture_output=True,
+                check=False,
+            ).stdout
+        except OSError as e:
+            raise SlurmBackendException(f'Cannot run "squeue":\n{e}') from e
+
+        # IDs are ASCII digits, so only they are decoded
+        return [x.decode() for x in output.split()]
+
+    @classmethod
+    def refresh(cls):
+        cls.load_jobs_once(force=True)
+
+    def _submit_args(self, task_metadata):
+        """Returns arguments to submit a job.
+
+        Args:
+            task_metadata (:obj:`TaskManageable.MetaDataHelper`): Metadata.
+
+        Returns:
+            :obj:`list` of :obj:`str`.
+        """
+        args = ["sbatch", "--parsable"]
+        for option in task_metadata.backend.options:
+            args.extend(shlex.split(option))
+        args.extend(["--wrap", task_metadata.backend.command])
+        return args
 
     def submit(self, task_metadata):
         super().submit(task_metadata)
@@ -49,26 +85,30 @@ class SlurmBackend(TaskManageable.Backend):
 
         task_metadata.backend.log_path = task_metadata.path.joinpath("backend.log")
 
-        self.load_jobs()
-        old_ids = self._job_ids
+        try:
+            process = subprocess.run(
+                self._submit_args(task_metadata), capture_output=True, check=False
+            )
+        except OSError as e:
+            raise SlurmBackendException(f'Cannot run "sbatch":\n{e}') from e
 
-        if os.system(self._generate_command(task_metadata)) != 0:
+        if process.returncode != 0:
             raise SlurmBackendException("Sbatch failed.")
+        self._invalidate_jobs()
 
-        self.load_jobs()
-
-        if len(old_ids) + 1 != len(self._job_ids):
+        # "--parsable" makes sbatch print "<job id>[;<cluster>]"
+        job_id = process.stdout.split(b";")[0].strip().decode()
+        if not job_id:
             raise SlurmBackendException("New job is not started")
-
-        job_id = list(self._job_ids - old_ids)[0]
         task_metadata.backend.id = job_id
 
-        self._logger.debug(f"New job ID: {screen_id}")
+        self._logger.debug(f"New job ID: {job_id}")
 
     def term(self, task_metadata):
         super().term(task_metadata)
-        if os.system(f"scancel {task_metadata.backend.id}") != 0:
+        if self._run(["scancel", task_metadata.backend.id]) != 0:
             raise SlurmBackendException(f"Cannot cancel job {task_metadata.backend.id}")
+        self._invalidate_jobs()
 
     def kill(self, task_metadata):
         super().kill(task_metadata)
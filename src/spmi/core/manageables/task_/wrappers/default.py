@@ -2,34 +2,44 @@
 """
 
 import os
-import time
+import re
+import shutil
 import signal
 import subprocess
-import multiprocessing
 from datetime import datetime
 from spmi.core.manageables.task import TaskManageable
 
 
+_SHELL_SYNTAX = re.compile(r"[|&;<>()$`\\\"'*?\[\]#~=%{}!\n]")
+""":obj:`re.Pattern`: Matches characters which need a shell to be interpreted."""
+
+
 class DefaultWrapper(TaskManageable.Wrapper):
 
     def __init__(self, metadata=None):
         super().__init__(metadata=metadata)
 
-    def _start_daemon_process(self):
-        """Starts a daemon process which prevents EOF of wrapped command."""
+    @staticmethod
+    def _popen(command, **kwargs):
+        """Starts command.
+
+        Commands without shell syntax are executed directly,
+        others (and not found programs, e.g. shell builtins)
+        are executed by ``/bin/sh``.
 
-        def daemon(exit_event, path):
-            fifo_write = os.open(path, os.O_WRONLY)
-            while not exit_event.is_set():
-                time.sleep(1)
-            os.close(fifo_write)
+        Args:
+            command (:obj:`str`): Command.
+            **kwargs: :class:`subprocess.Popen` arguments.
 
-        self._exit_event = multiprocessing.Event()
-        self._daemon_process = multiprocessing.Process(
-            target=daemon,
-            args=(self._exit_event, self._metadata.wrapper.stdin_path),
-        )
-        self._daemon_process.start()
+        Returns:
+            :obj:`subprocess.Popen`.
+        """
+        args = command.split()
+        if args and not _SHELL_SYNTAX.search(command):
+            executable = shutil.which(args[0])
+            if executable:
+                return subprocess.Popen(args, executable=executable, **kwargs)
+        return subprocess.Popen(command, shell=True, executable="/bin/sh", **kwargs)
 
     def start(self):
         self._logger.info(f'Starting "{self._metadata.wrapper.command}" process')
@@ -59,17 +69,20 @@ class DefaultWrapper(TaskManageable.Wrapper):
                 stdin_path = self._metadata.path.joinpath("process.stdin")
                 self._metadata.wrapper.stdin_path = stdin_path
 
-                self._logger.debug("Starting daemon process")
-                self._start_daemon_process()
-
                 self._logger.debug("Opening FIFO on read")
-                fifo_read = os.open(stdin_path, os.O_RDONLY)
+                fifo_read = os.open(stdin_path, os.O_RDONLY | os.O_NONBLOCK)
                 to_close.append(fifo_read)
 
+                # the write end is kept open by wrapper,
+                # so wrapped process doesn't get EOF
+                self._logger.debug("Opening FIFO on write")
+                fifo_write = os.open(stdin_path, os.O_WRONLY | os.O_NONBLOCK)
+                to_close.append(fifo_write)
+                os.set_blocking(fifo_read, True)
+
                 self._logger.debug("Starting wrapped process")
-                process = subprocess.Popen(
+                process = self._popen(
                     self._metadata.wrapper.command,
-                    shell=True,
                     stdout=stdout_write,
                     stdin=fifo_read,
                     stderr=stderr_write,
@@ -81,10 +94,6 @@ class DefaultWrapper(TaskManageable.Wrapper):
             process.wait()
             self._logger.info("Wrapped process finished")
 
-            self._logger.debug("Finishing daemon process")
-            self._exit_event.set()
-            self._daemon_process.join()
-
         finally:
             for f in to_close:
                 os.close(f)
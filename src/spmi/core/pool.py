@@ -1,11 +1,14 @@
 """Provides :class:`Pool`.
 """
 
+import os
+from itertools import chain
 from pathlib import Path
 from spmi.utils.pattern import PatternMatcher
 from spmi.utils.logger import Logger
 from spmi.core.manageable import Manageable, ManageableException
 from spmi.utils.exception import SpmiException
+from spmi.utils.concurrency import thread_map
 
 
 class PoolException(SpmiException):
@@ -42,23 +45,53 @@ class Pool:
 
             self._path = path
 
+        def _load(self, path):
+            """Loads a registered manageable.
+
+            Args:
+                path (:obj:`pathlib.Path`): Directory of manageable.
+
+            Returns:
+                :obj:`Union[spmi.core.manageable.Manageable, None]`: ``None``
+                if cannot load.
+            """
+            try:
+                return Manageable.from_directory_unknown(path)
+            except ManageableException as e:
+                self._logger.warning(
+                    f'Cannot load a registered manageable from "{path}":\n{e}'
+                )
+                return None
+
         def get_registered_manageables(self):
-            """Returns list of registered manageables.
+            """Returns registered manageables by their IDs.
+
+            Entries which are not directories are skipped.
+            Manageables are loaded in several threads, as loading
+            is mostly waiting for file reads and locks.
 
             Returns:
-                :obj:`list` of :obj:`spmi.core.manageable.Manageable`.
+                :obj:`dict`: :obj:`str` ID to
+                :obj:`spmi.core.manageable.Manageable`.
             """
             self._logger.debug("Loading registered manageables")
-            result = []
 
-            for path in self._path.iterdir():
-                try:
-                    result.append(Manageable.from_directory_unknown(path))
-                except ManageableException as e:
+            with os.scandir(self._path) as entries:
+                paths = [Path(entry.path) for entry in entries if entry.is_dir()]
+
+            loaded = thread_map(self._load, paths)
+
+            result = {}
+            for m in loaded:
+                if m is None:
+                    continue
+                manageable_id = m.state.id
+                if manageable_id in result:
                     self._logger.warning(
-                        f'Cannot load a registered manageable from "{path}":\n{e}'
+                        f'Skipping a manageable with duplicate ID "{manageable_id}"'
                     )
-
+                    continue
+                result[manageable_id] = m
             return result
 
         def register(self, manageable):
@@ -76,9 +109,10 @@ class Pool:
                     f"manageable must be a Manageable, not {type(manageable)}"
                 )
 
-            self._logger.debug("Registering a manageable {manageable.state.id}")
+            manageable_id = manageable.state.id
+            self._logger.debug(f"Registering a manageable {manageable_id}")
 
-            path = self._path.joinpath(manageable.state.id)
+            path = self._path.joinpath(manageable_id)
             manageable.register(path)
 
     def __init__(self, path, pm):
@@ -100,12 +134,32 @@ class Pool:
 
         self._pm = pm
         self._fsh = Pool.FileSystemHelper(path)
-        self._manageables = self._fsh.get_registered_manageables()
+        self._by_id = self._fsh.get_registered_manageables()
 
     @property
     def manageables(self):
         """:obj:`list` of :obj:`Manageable`. Copy of list with registered manageables."""
-        return list(self._manageables)
+        return list(self._by_id.values())
+
+    def refresh_backends(self, manageables=None):
+        """Refreshes shared state of manageables before checking their statuses.
+
+        Args:
+            manageables (:obj:`Union[list, None]`): Manageables to refresh.
+                If ``None``, refreshes all registered manageables.
+        """
+        if manageables is None:
+            manageables = self._by_id.values()
+
+        batches = {}
+        for m in manageables:
+            batches.setdefault(type(m), []).append(m)
+
+        for cls, batch in batches.items():
+            try:
+                cls.refresh_many(batch)
+            except SpmiException as e:
+                self._logger.warning(f"Cannot refresh {cls.__name__} state:\n{e}")
 
     def find(self, pattern):
         """Return list of manageables corresponding to pattern.
@@ -118,16 +172,34 @@ class Pool:
         """
         self._logger.debug(f'Searching "{pattern}"')
 
-        result = []
-        for m in self._manageables:
-            with m:
-                if self._pm.match(pattern, m.state.id):
-                    result.append(m)
+        if self._pm.is_literal(pattern):
+            m = self._by_id.get(pattern)
+            result = [] if m is None else [m]
+            self._logger.debug(f"Found {len(result)} results")
+            return result
+
+        # IDs never change, so the index keys are matched without loading
+        # metadata of each manageable.
+        match = self._pm.compile(pattern)
+        result = [m for i, m in self._by_id.items() if match(i)]
 
         self._logger.debug(f"Found {len(result)} results")
 
         return result
 
+    def find_all(self, patterns):
+        """Return list of manageables corresponding to any of patterns.
+
+        Each manageable is listed once, in order of first match.
+
+        Args:
+            patterns (:obj:`list` of :obj:`str`): Patterns to find.
+
+        Returns:
+            :obj:`list` of :obj:`spmi.core.manageable.Manageable`.
+        """
+        return list(dict.fromkeys(chain.from_iterable(map(self.find, patterns))))
+
     def register(self, manageable):
         """Registers a detected manageable.
 
@@ -139,15 +211,32 @@ class Pool:
             :class:`ManageableException`
             :class:`PoolException`
         """
-        self._logger.debug(f'Registering a new manageable "{manageable.state.id}"')
-        if manageable.state.id in map(lambda x: x.state.id, self._manageables):
+        manageable_id = manageable.state.id
+        self._logger.debug(f'Registering a new manageable "{manageable_id}"')
+        if manageable_id in self._by_id:
             raise PoolException(
-                f'Manageable with ID "{manageable.state.id}" is already registered'
+                f'Manageable with ID "{manageable_id}" is already registered'
             )
         if not isinstance(manageable, Manageable):
             raise TypeError(f"manageable must be a Manageable, not {type(manageable)}")
 
         self._fsh.register(manageable)
-        self._manageables.append(manageable)
+        self._by_id[manageable_id] = manageable
+
+        self._logger.debug(f'Manageable "{manageable_id}" registered')
+
+    def remove(self, manageables):
+        """Removes destructed manageables from pool.
+
+        The ID index is rebuilt once for the whole batch.
+
+        Args:
+            manageables (:obj:`list` of :obj:`spmi.core.manageable.Manageable`): Manageables to remove.
+        """
+        to_remove = {id(m) for m in manageables}
+        if not to_remove:
+            return
+
+        self._by_id = {k: m for k, m in self._by_id.items() if id(m) not in to_remove}
 
-        self._logger.debug(f'Manageable "{manageable.state.id}" registered')
+        self._logger.debug(f"Removed {len(to_remove)} manageables")
@@ -0,0 +1,29 @@
+"""Provides functions to run work in threads.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+
+MAX_WORKERS = 32
+""":obj:`int`: Maximum number of threads used by :func:`thread_map`."""
+
+
+def thread_map(function, items):
+    """Applies ``function`` to every item in several threads.
+
+    Threads only pay off for I/O bound work, e.g. reading files.
+    Fewer than two items are processed in the calling thread.
+    The first exception raised by ``function`` is propagated.
+
+    Args:
+        function (:obj:`callable`): Function of one argument.
+        items (:obj:`list`): Arguments.
+
+    Returns:
+        :obj:`list`: Results in order of ``items``.
+    """
+    if len(items) < 2:
+        return list(map(function, items))
+
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(items))) as executor:
+        return list(executor.map(function, items))
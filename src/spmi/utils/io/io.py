@@ -2,14 +2,27 @@
 """
 
 import os
+import stat
 import fcntl
+import inspect
+import pkgutil
+import importlib
+from functools import lru_cache
 from abc import ABCMeta, abstractmethod
 from pathlib import Path
 import spmi.utils.io.ios as ios_package
-from spmi.utils.load import load_class_from_package
+from spmi.utils.load import get_class_name
 from spmi.utils.exception import SpmiException
 
 
+_IO_SUFFIXES = frozenset(
+    name[:-2]
+    for _, name, _ in pkgutil.iter_modules(ios_package.__path__)
+    if name.endswith("io")
+)
+""":obj:`frozenset` of :obj:`str`: Suffixes (without dot) which have loaders."""
+
+
 class IoException(SpmiException):
     pass
 
@@ -25,6 +38,8 @@ class Io(metaclass=ABCMeta):
     files.
     """
 
+    __slots__ = ("_path", "_fd", "_text")
+
     def __init__(self, path):
         """
         Args:
@@ -35,6 +50,7 @@ class Io(metaclass=ABCMeta):
         """
         self.path = path
         self._fd = None
+        self._text = None
 
     @abstractmethod
     def copy(self):
@@ -54,8 +70,13 @@ class Io(metaclass=ABCMeta):
     def path(self, value):
         if not isinstance(value, Path):
             raise TypeError(f"path must be a pathlib.Path, not {type(value)}")
-        if value.exists() and not value.is_file():
-            raise TypeError(f'path "{value}" must be a file')
+        try:
+            mode = os.stat(value).st_mode
+        except (FileNotFoundError, NotADirectoryError):
+            pass
+        else:
+            if not stat.S_ISREG(mode):
+                raise TypeError(f'path "{value}" must be a file')
 
         self._path = value
 
@@ -124,21 +145,50 @@ class Io(metaclass=ABCMeta):
         """
         if not self._fd:
             raise IoException("Should be called inside \"with\" statement")
+
+    def _read(self):
+        """Reads whole file and remembers its content.
+
+        Returns:
+            :obj:`str`.
+        """
+        self._text = self._fd.read()
+        return self._text
+
+    def _write(self, text):
+        """Replaces file content by ``text``.
+
+        Nothing is written if the file already has this content,
+        which was read or written inside the current ``with`` statement.
+
+        Args:
+            text (:obj:`str`): New content.
+        """
+        if text == self._text:
+            return
         self._fd.seek(0)
         self._fd.truncate(0)
+        self._fd.write(text)
+        self._text = text
 
     def __enter__(self):
         if not self._fd is None:
             raise IoException("Already inside \"with\" statement")
-        self.path.touch()
-        self._fd = open(self.path, "r+")
-        fcntl.flock(self._fd.fileno(), fcntl.LOCK_EX)
+        # creates the file if needed and opens it by one syscall
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            self._fd = os.fdopen(fd, "r+")
+        except BaseException:
+            os.close(fd)
+            raise
 
     def __exit__(self, exc_type, exc_value, traceback):
         assert not self._fd is None
         fcntl.flock(self._fd.fileno(), fcntl.LOCK_UN)
         self._fd.close()
         self._fd = None
+        self._text = None
 
     @staticmethod
     def has_io(suffix):
@@ -161,10 +211,7 @@ class Io(metaclass=ABCMeta):
         if not suffix.startswith("."):
             raise ValueError("suffix must be a return of pathlib.Path.suffix")
 
-        suffix = suffix[1:]
-        ios = Path(__file__).parent.joinpath("ios").iterdir()
-
-        return f"{suffix}io" in [x.stem for x in ios]
+        return suffix[1:] in _IO_SUFFIXES
 
     @staticmethod
     def get_io(path):
@@ -186,9 +233,33 @@ class Io(metaclass=ABCMeta):
             raise IoException(f"Unsupported suffix: {path.suffix}")
 
         try:
-            cls = load_class_from_package(
-                f"{path.suffix[1:].capitalize()}Io", ios_package
-            )
-            return cls(path)
+            return Io._io_class(path.suffix[1:])(path)
         except NotImplementedError as e:
             raise IoException(f"Unsupported suffix: {path.suffix} ({e})") from e
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _io_class(suffix):
+        """Returns :class:`Io` class by suffix, classes are looked up once.
+
+        Class of suffix ``foo`` is ``FooIo`` in module ``ios.fooio``.
+
+        Args:
+            suffix (:obj:`str`): Suffix without dot.
+
+        Returns:
+            :obj:`class`.
+
+        Raises:
+            :class:`NotImplementedError`
+        """
+        classname = get_class_name(suffix, "Io")
+        try:
+            module = importlib.import_module(f"{ios_package.__name__}.{suffix}io")
+        except ImportError as e:
+            raise NotImplementedError(f'Cannot import module for "{classname}": {e}') from e
+
+        cls = getattr(module, classname, None)
+        if not inspect.isclass(cls):
+            raise NotImplementedError(f'Cannot find "{classname}" in {module}')
+        return cls
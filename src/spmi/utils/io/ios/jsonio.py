@@ -1,6 +1,13 @@
 """Provides class :class:`JsonIo`.
+
+Files are loaded with :mod:`orjson` if it is installed. They are always
+dumped with :mod:`json`, as :mod:`orjson` cannot produce the same format.
 """
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import json
 from spmi.utils.io.io import Io, IoException
 
@@ -10,13 +17,18 @@ class JsonIoException(IoException):
 class JsonIo(Io):
     """JSON formatted io."""
 
+    __slots__ = ()
+
     def copy(self):
         return JsonIo(path=self.path)
 
     def load(self):
         super().load()
         try:
-            result = json.load(self._fd)
+            text = self._read()
+            if orjson is not None:
+                return orjson.loads(text)
+            result = json.loads(text)
             return result
         except Exception as e:
             raise JsonIoException(f"Cannot load from \"{self.path}\":\n{e}") from e
@@ -24,6 +36,6 @@ class JsonIo(Io):
     def dump(self, data):
         super().dump(data)
         try:
-            json.dump(data, self._fd, indent=4)
+            self._write(json.dumps(data, indent=4))
         except Exception as e:
             raise JsonIoException(f"Cannot dump to \"{self.path}\":\n{e}") from e
@@ -1,7 +1,13 @@
 """Provides class :class:`TomlIo`.
+
+Files are loaded with :mod:`tomllib` if it is available (Python 3.11+),
+:mod:`toml` is imported only when needed.
 """
 
-import toml
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
 from spmi.utils.io.io import Io, IoException
 
 class TomlIoException(IoException):
@@ -10,13 +16,20 @@ class TomlIoException(IoException):
 class TomlIo(Io):
     """TOML formatted io."""
 
+    __slots__ = ()
+
     def copy(self):
         return TomlIo(path=self.path)
 
     def load(self):
         super().load()
         try:
-            result = toml.load(self._fd)
+            text = self._read()
+            if tomllib is None:
+                import toml
+
+                return toml.loads(text)
+            result = tomllib.loads(text)
             return result
         except Exception as e:
             raise TomlIoException(f"Cannot load from \"{self.path}\":\n{e}") from e
@@ -24,6 +37,8 @@ class TomlIo(Io):
     def dump(self, data):
         super().dump(data)
         try:
-            toml.dump(data, self._fd)
+            import toml
+
+            self._write(toml.dumps(data))
         except Exception as e:
             raise TomlIoException(f"Cannot dump to \"{self.path}\":\n{e}") from e
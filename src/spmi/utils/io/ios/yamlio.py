@@ -1,7 +1,13 @@
 """Provides class :class:`YamlIo`.
+
+Uses LibYAML based loader and dumper if PyYAML is built with it.
 """
 
 import yaml
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
 from spmi.utils.io.io import Io, IoException
 
 class YamlIoException(IoException):
@@ -10,13 +16,15 @@ class YamlIoException(IoException):
 class YamlIo(Io):
     """Yaml formatted io."""
 
+    __slots__ = ()
+
     def copy(self):
-        return YamlIo(path=self.path, encoding=self.encoding)
+        return YamlIo(path=self.path)
 
     def load(self):
         super().load()
         try:
-            result = yaml.safe_load(self._fd)
+            result = yaml.load(self._read(), Loader=_Loader)
             return result
         except Exception as e:
             raise YamlIoException(f"Cannot load from \"{self.path}\":\n{e}") from e
@@ -24,6 +32,6 @@ class YamlIo(Io):
     def dump(self, data):
         super().dump(data)
         try:
-            yaml.dump(data, self._fd)
+            self._write(yaml.dump(data, Dumper=_Dumper))
         except Exception as e:
             raise YamlIoException(f"Cannot dump to \"{self.path}\":\n{e}") from e
@@ -4,9 +4,54 @@
 import inspect
 import pkgutil
 import importlib
+from functools import lru_cache
 from pathlib import Path
 
 
+_PACKAGE_MODULES = {}
+""":obj:`dict`: Names of package modules by package name."""
+
+
+def package_modules(package):
+    """Returns names of ``package`` modules.
+
+    The package directory is listed once, later calls return
+    the cached result.
+
+    Args:
+        package (Python package): Package.
+
+    Returns:
+        :obj:`tuple` of :obj:`str`.
+    """
+    try:
+        return _PACKAGE_MODULES[package.__name__]
+    except KeyError:
+        names = tuple(
+            mname for _, mname, _ in pkgutil.iter_modules([Path(package.__file__).parent])
+        )
+        _PACKAGE_MODULES[package.__name__] = names
+        return names
+
+
+@lru_cache(maxsize=128)
+def get_class_name(name, suffix):
+    """Returns classname by type name.
+
+    Words of ``name`` are capitalized and joined, then ``suffix``
+    is appended, e.g. ``"foo bar"`` and ``"Backend"`` give
+    ``"FooBarBackend"``.
+
+    Args:
+        name (:obj:`str`): Space separated type name.
+        suffix (:obj:`str`): Classname suffix.
+
+    Returns:
+        :obj:`str`.
+    """
+    return "".join([x.capitalize() for x in name.split()]) + suffix
+
+
 def load_class_from_package(classname, package):
     """Loads class from package by name.
 
@@ -29,11 +74,11 @@ def load_class_from_package(classname, package):
     if not inspect.ismodule(package):
         raise TypeError(f"package must be a module, not {type(package)}")
 
-    for _, mname, _ in pkgutil.iter_modules([Path(package.__file__).parent]):
+    for mname in package_modules(package):
         module = importlib.import_module(package.__name__ + "." + mname)
-        classes = inspect.getmembers(module, inspect.isclass)
-        classes = list(filter(lambda x: x[0] == classname, classes))
-        if len(classes) == 1:
-            return classes[0][1]
+        cls = getattr(module, classname, None)
+        if inspect.isclass(cls):
+            return cls
 
     raise NotImplementedError(f'Cannot find "{classname}" in {package}')
+
@@ -2,6 +2,7 @@
 """
 
 import logging
+import threading
 
 class Logger:
     """Provides logging methods."""
@@ -28,6 +29,9 @@ class Logger:
             formatter = logging.Formatter(log_fmt)
             return formatter.format(record)
 
+    _lock = threading.Lock()
+    """:obj:`threading.Lock`: Guards handlers setup of loggers."""
+
     @staticmethod
     def basic_config(loglevel="INFO"):
         """Sets up logging basic config.
@@ -48,11 +52,12 @@ class Logger:
             name (:obj:`str`): Logger name.
         """
         self._logger = logging.getLogger(name)
-        self._logger.handlers.clear()
         ch = logging.StreamHandler()
         ch.setFormatter(Logger.DefaultFormatter())
-        self._logger.addHandler(ch)
-        self._logger.propagate = False
+        with Logger._lock:
+            self._logger.handlers.clear()
+            self._logger.addHandler(ch)
+            self._logger.propagate = False
 
     def debug(self, msg):
         """Debug a message.
@@ -1,6 +1,7 @@
 """Provides :class:`Metadata` and :class:`SubDict`.
 """
 
+import os
 from copy import deepcopy
 from pathlib import Path
 from spmi.utils.io.io import Io
@@ -74,6 +75,8 @@ class MetaDataNode:
     If ``mutable`` flag is set to ``False``, ``meta`` become immutable.
     """
 
+    __slots__ = ("_logger", "__mutable", "_path_cache", "_meta", "_data")
+
     def __init__(self, meta=None, data=None, metadata=None, mutable=True, copy=False):
         """
         Args:
@@ -93,6 +96,7 @@ class MetaDataNode:
         """
         self._logger = Logger(self.__class__.__name__)
         self.__mutable = mutable
+        self._path_cache = {}
 
         if metadata is None:
             if data is None:
@@ -162,6 +166,43 @@ class MetaDataNode:
             self._logger.debug(f'Failed "{p}" attribute')
             raise IncorrectProperty(f'Property "{p}" is incorrect:\n{e}') from e
 
+    def _get_path(self, key):
+        """Returns ``meta[key]`` as :obj:`pathlib.Path`.
+
+        Converted paths are cached by their string values.
+
+        Args:
+            key (:obj:`str`): Meta key.
+
+        Returns:
+            :obj:`Union[pathlib.Path, None]`: ``None`` if value is empty.
+        """
+        value = self._meta.get(key)
+        if not value:
+            return None
+        try:
+            return self._path_cache[value]
+        except KeyError:
+            path = self._path_cache[value] = Path(value)
+            return path
+
+    def _set_path(self, key, value):
+        """Sets ``meta[key]`` to absolute ``value``.
+
+        Relative paths are made absolute without touching
+        the filesystem, absolute ones are stored as is.
+
+        Args:
+            key (:obj:`str`): Meta key.
+            value (:obj:`Union[pathlib.Path, None]`): Path.
+        """
+        if value is None:
+            self._meta[key] = None
+            return
+        path = value if value.is_absolute() else Path(os.path.abspath(value))
+        self._meta[key] = str(path)
+        self._path_cache[self._meta[key]] = path
+
     @property
     def mutable(self):
         """:obj:`bool`: True if this object is mutable."""
@@ -191,6 +232,8 @@ class MetaDataNode:
 class MetaData(MetaDataNode):
     """Provides property and file access to meta and data."""
 
+    __slots__ = ("__entered", "__data_io", "__meta_io", "__state")
+
     def __init__(self, data=None, meta=None, mutable=True, metadata=None, copy=True):
         """
         Args:
@@ -212,6 +255,7 @@ class MetaData(MetaDataNode):
             :class:`MetaDataError`
         """
         self.__entered = False
+        self.__state = None
         if metadata is None:
             self.__data_io = None
             self.__meta_io = None
@@ -307,8 +351,21 @@ class MetaData(MetaDataNode):
     @dontcheck
     @property
     def state(self):
-        """:obj:`MetaData` Copies self to immutable object of ``self.__class__``."""
-        return self.__class__(metadata=self, mutable=False)
+        """:obj:`MetaData` Copies self to immutable object of ``self.__class__``.
+
+        The copy is reused while meta, data and file paths are equal
+        to the copied ones, comparing is much cheaper than copying.
+        """
+        state = self.__state
+        if (
+            state is None
+            or state._meta != self._meta
+            or state._data != self._data
+            or state.data_path != self.data_path
+            or state.meta_path != self.meta_path
+        ):
+            state = self.__state = self.__class__(metadata=self, mutable=False)
+        return state
 
     def load(self):
         """Loads meta and data from files.
@@ -399,9 +456,20 @@ class MetaData(MetaDataNode):
         if self.__entered:
             raise MetaDataError('Already entered "with" statement')
         self.__meta_io.__enter__()
-        self.__data_io.__enter__()
+        try:
+            self.__data_io.__enter__()
+        except BaseException:
+            self.__meta_io.__exit__(None, None, None)
+            raise
         self.__entered = True
-        self.load()
+        try:
+            self.load()
+        except BaseException:
+            # nothing was changed, so release files without dumping
+            self.__entered = False
+            self.__data_io.__exit__(None, None, None)
+            self.__meta_io.__exit__(None, None, None)
+            raise
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
@@ -2,6 +2,7 @@
 """
 
 import re
+from functools import lru_cache
 from abc import ABCMeta, abstractmethod
 
 
@@ -21,6 +22,37 @@ class PatternMatcher(metaclass=ABCMeta):
         if not isinstance(string, str):
             raise TypeError(f"string must be a str, not {type(string)}")
 
+    def is_literal(self, pattern):
+        """Returns ``True`` if ``pattern`` matches only itself.
+
+        Default implementation returns ``False``.
+
+        Args:
+            pattern (:obj:`str`): Pattern.
+
+        Returns:
+            :obj:`bool`.
+        """
+        return False
+
+    def compile(self, pattern):
+        """Returns a function which checks if a string matches ``pattern``.
+
+        Default implementation calls :meth:`match`.
+
+        Args:
+            pattern (:obj:`str`): Pattern.
+
+        Returns:
+            :obj:`callable` taking a :obj:`str` and returning :obj:`bool`.
+
+        Raises:
+            :obj:`ValueError`
+        """
+        if not self.is_pattern(pattern):
+            raise ValueError("pattern must be a pattern string")
+        return lambda string: self.match(pattern, string)
+
     @abstractmethod
     def match(self, pattern, string):
         """Returns ``True`` if ``string`` matches ``pattern``.
@@ -49,6 +81,14 @@ class SimplePatternMatcher(PatternMatcher):
         super().is_pattern(string)
         return True
 
+    def is_literal(self, pattern):
+        return True
+
+    def compile(self, pattern):
+        if not self.is_pattern(pattern):
+            raise ValueError("pattern must be a pattern string")
+        return lambda string: string == pattern
+
     def match(self, pattern, string):
         super().match(pattern, string)
         return string == pattern
@@ -57,6 +97,12 @@ class SimplePatternMatcher(PatternMatcher):
 class RegexPatternMatcher(PatternMatcher):
     """Regex pattern matcher."""
 
+    _SPECIAL = re.compile(r"[.^$*+?{}\[\]\\|()]")
+    """:obj:`re.Pattern`: Matches regex special characters."""
+
+    def is_literal(self, pattern):
+        return self._SPECIAL.search(pattern) is None
+
     def is_pattern(self, string):
         super().is_pattern(string)
         try:
@@ -65,7 +111,24 @@ class RegexPatternMatcher(PatternMatcher):
         except Exception:
             return False
 
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _compile(pattern):
+        """Returns compiled ``pattern``, repeated patterns are cached.
+
+        Args:
+            pattern (:obj:`str`): Pattern.
+
+        Returns:
+            :obj:`re.Pattern`.
+        """
+        return re.compile(pattern)
+
+    def compile(self, pattern):
+        if not self.is_pattern(pattern):
+            raise ValueError("pattern must be a pattern string")
+        return self._compile(pattern).fullmatch
+
     def match(self, pattern, string):
         super().match(pattern, string)
-        p = re.compile(pattern)
-        return p.fullmatch(string)
+        return self._compile(pattern).fullmatch(string)